@@ -1,3 +1,4 @@
+from contextlib import contextmanager
 from pathlib import Path
 from ruamel.yaml import YAML
 from ruamel.yaml.comments import CommentedMap as OrderedDict, CommentedSeq as OrderedList
@@ -24,6 +25,8 @@ class ComposeFile:
         self.compose_path: Path = loadfile
         self.template_name = template_name
         self.is_template_loaded = False
+        self._batch_edit_depth = 0
+        self._write_pending = False
 
         self.template_dir = 'templates'
 
@@ -437,10 +440,35 @@ class ComposeFile:
         except KeyError:
             return None
 
+    @contextmanager
+    def batch_edit(self):
+        """
+        Defers writing the compose file till the end of the block.
+
+        All write_to_file calls made inside the block are coalesced into a single write on exit,
+        nothing is written if the block raises an exception.
+        """
+        self._batch_edit_depth += 1
+        try:
+            yield self
+        except Exception:
+            self._write_pending = False
+            raise
+        finally:
+            self._batch_edit_depth -= 1
+
+        if not self._batch_edit_depth and self._write_pending:
+            self._write_pending = False
+            self.write_to_file()
+
     def write_to_file(self):
         """
         Writes the Docker Compose file to the specified path.
         """
+        if self._batch_edit_depth:
+            self._write_pending = True
+            return
+
         try:
             # saving the docker compose to the directory
             with open(self.compose_path, "w") as f:
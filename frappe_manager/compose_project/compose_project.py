@@ -1,5 +1,8 @@
 import json
-from typing import List
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from queue import Empty, Queue
+from typing import Any, Callable, List, Optional, Tuple
 from rich.text import Text
 from frappe_manager.compose_manager.ComposeFile import ComposeFile
 from frappe_manager.compose_project.exceptions import (
@@ -13,12 +16,31 @@ from frappe_manager.docker_wrapper.DockerClient import DockerClient
 from frappe_manager.docker_wrapper.DockerException import DockerException
 from frappe_manager.display_manager.DisplayManager import richprint
 
+# seconds for which a services running status snapshot is reused
+STATUS_SNAPSHOT_TTL = 2
+
 
 class ComposeProject:
     def __init__(self, compose_file_manager: ComposeFile, verbose: bool = False):
         self.compose_file_manager: ComposeFile = compose_file_manager
         self.docker: DockerClient = DockerClient(compose_file_path=self.compose_file_manager.compose_path)
         self.quiet = not verbose
+        self.output_queue: Optional[Queue] = None
+        self._status_snapshot: Optional[dict] = None
+        self._status_snapshot_time: float = 0
+
+    def live_output(self, output):
+        """
+        Displays the streamed output of a compose command.
+
+        When an output queue is attached, the output is forwarded to it instead so that
+        it can be rendered from a single thread.
+        """
+        if self.output_queue is None:
+            richprint.live_lines(output, padding=(0, 0, 0, 2))
+        else:
+            for line in output:
+                self.output_queue.put(line)
 
     def start_service(self, services: List[str] = [], force_recreate: bool = False):
         """
@@ -29,9 +51,11 @@ class ComposeProject:
                 services=services, detach=True, pull="never", force_recreate=force_recreate, stream=self.quiet
             )
             if self.quiet:
-                richprint.live_lines(output, padding=(0, 0, 0, 2))
+                self.live_output(output)
         except DockerException as e:
             raise DockerComposeProjectFailedToStartError(self.compose_file_manager.compose_path, services)
+        finally:
+            self.invalidate_status_snapshot()
 
     def stop_service(self, services: List[str] = [], timeout: int = 100):
         """
@@ -40,11 +64,13 @@ class ComposeProject:
         try:
             output = self.docker.compose.stop(services=services, timeout=timeout, stream=self.quiet)
             if self.quiet:
-                richprint.live_lines(output, padding=(0, 0, 0, 2))
+                self.live_output(output)
         except DockerException as e:
             raise DockerComposeProjectFailedToStopError(
                 self.compose_file_manager.compose_path, self.compose_file_manager.get_services_list()
             )
+        finally:
+            self.invalidate_status_snapshot()
 
     def down_service(self, remove_ophans=True, volumes=True, timeout=5):
         """
@@ -62,11 +88,13 @@ class ComposeProject:
                 timeout=timeout,
                 stream=True,
             )
-            richprint.live_lines(output, padding=(0, 0, 0, 2))
+            self.live_output(output)
         except DockerException as e:
             raise DockerComposeProjectFailedToRemoveError(
                 self.compose_file_manager.compose_path, self.compose_file_manager.get_services_list()
             )
+        finally:
+            self.invalidate_status_snapshot()
 
     def pull_images(self):
         """
@@ -105,7 +133,7 @@ class ComposeProject:
             bool: True if all services are running, False otherwise.
         """
         services = self.compose_file_manager.get_services_list()
-        running_status = self.get_services_running_status()
+        running_status = self.status_snapshot()
 
         if not running_status:
             return False
@@ -188,15 +216,30 @@ class ComposeProject:
         except DockerException as e:
             return []
 
+    def status_snapshot(self) -> dict:
+        """
+        Get the running status of services, reusing the last result for STATUS_SNAPSHOT_TTL seconds.
+
+        Compose operations changing the state of services invalidate the snapshot.
+
+        Returns:
+            A dictionary containing the running status of services.
+            The keys are the service names, and the values are the container states.
+        """
+        now = time.monotonic()
+        if self._status_snapshot is None or now - self._status_snapshot_time > STATUS_SNAPSHOT_TTL:
+            self._status_snapshot = self.get_services_running_status()
+            self._status_snapshot_time = now
+        return dict(self._status_snapshot)
+
+    def invalidate_status_snapshot(self):
+        """
+        Discard the cached services running status snapshot.
+        """
+        self._status_snapshot = None
+
     def is_service_running(self, service):
-        running_status = self.get_services_running_status()
-        try:
-            if running_status[service] == "running":
-                return True
-            else:
-                return False
-        except KeyError:
-            return False
+        return self.status_snapshot().get(service) == "running"
 
     def restart_service(self, services: List[str] = []):
         try:
@@ -207,3 +250,80 @@ class ComposeProject:
             raise DockerComposeProjectFailedToRestartError(
                 self.compose_file_manager.compose_path, self.compose_file_manager.get_services_list()
             )
+        finally:
+            self.invalidate_status_snapshot()
+
+
+def run_compose_operations_parallel(operations: List[Tuple[ComposeProject, Callable[[], Any]]]):
+    """
+    Runs independent compose project operations concurrently.
+
+    The output of every compose project is funnelled through a single queue and rendered
+    on the calling thread, since richprint is not thread safe.
+
+    Args:
+        operations (List[Tuple[ComposeProject, Callable]]): Compose projects and the operation to run on each of them.
+
+    Raises:
+        Exception: The first exception raised by any of the operations.
+    """
+    output_queue: Queue = Queue()
+
+    for compose_project, _ in operations:
+        compose_project.output_queue = output_queue
+
+    try:
+        with ThreadPoolExecutor(max_workers=len(operations)) as executor:
+            futures = [executor.submit(operation) for _, operation in operations]
+
+            def queued_output():
+                while True:
+                    try:
+                        yield output_queue.get(timeout=0.1)
+                    except Empty:
+                        if all(future.done() for future in futures) and output_queue.empty():
+                            return
+
+            richprint.live_lines(queued_output(), padding=(0, 0, 0, 2))
+
+            for future in as_completed(futures):
+                future.result()
+    finally:
+        for compose_project, _ in operations:
+            compose_project.output_queue = None
+
+
+def get_services_running_status_bulk(compose_projects: List[ComposeProject], container_name_prefix: str) -> List[dict]:
+    """
+    Get the running status of services of multiple compose projects using a single docker ps call.
+
+    Args:
+        compose_projects (List[ComposeProject]): Compose projects whose containers share the container name prefix.
+        container_name_prefix (str): The container name prefix of the compose projects.
+
+    Returns:
+        List[dict]: Services running status of each compose project, in the same order as compose_projects.
+    """
+    services_status: List[dict] = [{} for _ in compose_projects]
+
+    # container name -> (compose project index, service name)
+    containers = {}
+    for index, compose_project in enumerate(compose_projects):
+        for service, container_name in compose_project.compose_file_manager.get_container_names().items():
+            containers[container_name] = (index, service)
+
+    if not containers:
+        return services_status
+
+    try:
+        output = compose_projects[0].docker.ps(all=True, filter=[f"name=^{container_name_prefix}-"])
+    except DockerException as e:
+        return services_status
+
+    # this is done to exclude docker runs using docker compose run command
+    for container in output:
+        if container["Names"] in containers:
+            index, service = containers[container["Names"]]
+            services_status[index][service] = container["State"]
+
+    return services_status
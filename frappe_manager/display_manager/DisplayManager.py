@@ -9,12 +9,17 @@ from rich.padding import Padding
 from rich.table import Table
 
 import typer
+import threading
 from collections import deque
 from typing import Optional
 
 error = Style()
 theme = Theme({"errors": error})
 
+# lowercased markers of docker progress output which is not shown in live lines
+_PROGRESS_BAR = "[=="
+_UPDATING_FILES = "updating files:"
+
 
 class DisplayManager:
     def __init__(self):
@@ -24,6 +29,7 @@ class DisplayManager:
         self.current_head = None
         self.spinner = Spinner(text=self.current_head, name="dots2", speed=1)
         self.live = Live(self.spinner, console=self.stdout, transient=True)
+        self.head_lock = threading.Lock()
 
     def start(self, text: str):
         """
@@ -136,13 +142,15 @@ class DisplayManager:
         Returns:
             None
         """
-        self.previous_head = self.current_head
-        self.current_head = text
-        if style:
-            self.spinner.update(text=Text(self.current_head, style="blue bold"))
-        else:
-            self.spinner.update(text=self.current_head)
-        self.live.refresh()
+        # head can be changed from worker threads
+        with self.head_lock:
+            self.previous_head = self.current_head
+            self.current_head = text
+            if style:
+                self.spinner.update(text=Text(self.current_head, style="blue bold"))
+            else:
+                self.spinner.update(text=self.current_head)
+            self.live.refresh()
 
     def update_live(self, renderable=None, padding: tuple = (0, 0, 0, 0)):
         """
@@ -188,13 +196,17 @@ class DisplayManager:
         max_height = lines
         displayed_lines = deque(maxlen=max_height)
 
+        if stop_string:
+            stop_string = stop_string.lower()
+
         while True:
             try:
                 source, line = next(data)
                 line = line.decode()
+                lowered_line = line.lower()
                 # print(' --',line)
 
-                if "[==".lower() in line.lower() or 'Updating files:'.lower() in line.lower():
+                if _PROGRESS_BAR in lowered_line or _UPDATING_FILES in lowered_line:
                     continue
 
                 if source == "stdout" and stdout:
@@ -203,7 +215,7 @@ class DisplayManager:
                 if source == "stderr" and stderr:
                     displayed_lines.append(line)
 
-                if stop_string and stop_string.lower() in line.lower():
+                if stop_string and stop_string in lowered_line:
                     raise StopIteration
 
                 table = Table(show_header=False, box=None)
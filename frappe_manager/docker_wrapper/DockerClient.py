@@ -185,6 +185,37 @@ class DockerClient:
         iterator = run_command_with_exit_code(self.docker_cmd + run_cmd, stream=stream)
         return iterator
 
+    def exec(
+        self,
+        container: str,
+        command: str,
+        user: Optional[str] = None,
+        workdir: Optional[str] = None,
+        env: Optional[List[str]] = None,
+        use_shlex_split: bool = True,
+        stream: bool = False,
+    ):
+        parameters: dict = locals()
+        exec_cmd: list = ["exec"]
+
+        remove_parameters = ["stream", "command", "container", "use_shlex_split", "env"]
+
+        exec_cmd += parameters_to_options(parameters, exclude=remove_parameters)
+
+        if isinstance(env, list):
+            for i in env:
+                exec_cmd += ["--env", i]
+
+        exec_cmd += [container]
+
+        if use_shlex_split:
+            exec_cmd += shlex.split(command, posix=True)
+        else:
+            exec_cmd += [command]
+
+        iterator = run_command_with_exit_code(self.docker_cmd + exec_cmd, stream=stream)
+        return iterator
+
     def pull(
         self,
         container_name: str,
@@ -230,3 +261,33 @@ class DockerClient:
                 images.append(json.loads(image))
 
         return images
+
+    def ps(
+        self,
+        all: bool = False,
+        filter: Optional[List[str]] = None,
+        format: Literal['json'] = 'json',
+    ):
+        parameters: dict = locals()
+
+        ps_cmd: list[str] = ["ps"]
+        remove_parameters = ["filter"]
+
+        ps_cmd += parameters_to_options(parameters, exclude=remove_parameters)
+
+        if isinstance(filter, list):
+            for i in filter:
+                ps_cmd += ["--filter", i]
+
+        output: SubprocessOutput = run_command_with_exit_code(
+            self.docker_cmd + ps_cmd,
+            stream=False,
+        )
+
+        containers = []
+
+        if output.stdout:
+            for container in output.stdout:
+                containers.append(json.loads(container))
+
+        return containers
@@ -1,9 +1,10 @@
 import time
 from pathlib import Path
-from typing import Dict, Any, Optional, Protocol, List, Union
+from typing import Dict, Any, Optional, Protocol, List, Tuple, Union
 from frappe_manager.compose_project.compose_project import ComposeProject
 from frappe_manager.docker_wrapper.DockerException import DockerException
 from frappe_manager.services_manager.services_exceptions import (
+    DatabaseServiceDBAndUserRemoveFailError,
     DatabaseServiceDBCreateFailed,
     DatabaseServiceDBExportFailed,
     DatabaseServiceDBImportFailed,
@@ -81,6 +82,9 @@ class DatabaseServiceManager(Protocol):
     def remove_db(self, db_name: str):
         ...
 
+    def drop_db_and_user(self, db_name: str, db_user: str) -> Tuple[bool, bool]:
+        ...
+
     def wait_till_db_start(self, interval: int = 5, timeout: int = 30) -> bool:
         ...
 
@@ -202,6 +206,34 @@ class MariaDBManager(DatabaseServiceManager):
         remove_db_exception = DatabaseServiceDBRemoveFailError(db_name, self.database_server_info.host)
         self.db_run_query(remove_db_command, remove_db_exception)
 
+    def drop_db_and_user(self, db_name: str, db_user: str) -> Tuple[bool, bool]:
+        """
+        Drops the database and the user for all of its hosts using a single query.
+
+        Returns:
+            Tuple[bool, bool]: Whether the database and the user existed before being dropped.
+        """
+        drop_db_and_user_command = (
+            "'"
+            f'SELECT (SELECT COUNT(*) FROM information_schema.SCHEMATA WHERE SCHEMA_NAME = "{db_name}"), '
+            f'(SELECT COUNT(*) FROM mysql.user WHERE User = "{db_user}");'
+            f'SELECT IFNULL(CONCAT("DROP USER ", GROUP_CONCAT(CONCAT("`", User, "`@`", Host, "`"))), "DO 0") '
+            f'INTO @drop_users FROM mysql.user WHERE User = "{db_user}";'
+            f'DROP DATABASE IF EXISTS `{db_name}`;'
+            'PREPARE drop_users FROM @drop_users;'
+            'EXECUTE drop_users;'
+            'DEALLOCATE PREPARE drop_users;'
+            "'"
+        )
+        drop_db_and_user_exception = DatabaseServiceDBAndUserRemoveFailError(
+            db_name, db_user, self.database_server_info.host
+        )
+        output: SubprocessOutput = self.db_run_query(
+            drop_db_and_user_command, drop_db_and_user_exception, capture_output=True
+        )
+        db_count, user_count = output.stdout[0].split('\t')
+        return int(db_count) > 0, int(user_count) > 0
+
     def grant_user_privilages(self, db_user: str, db_name: str):
         grant_user_command = f"'GRANT ALL PRIVILEGES ON `{db_name}`.* TO `{db_user}`@`%`;'"
         grant_user_exception = DatabaseServiceException(
@@ -49,6 +49,14 @@ class DatabaseServiceDBRemoveFailError(DatabaseServiceException):
         self.message = message.format(db_name)
         super().__init__(self.service_name,self.message)
 
+class DatabaseServiceDBAndUserRemoveFailError(DatabaseServiceException):
+    def __init__(self,db_name: str, username: str, service_name: str, message = 'Failed to remove db {} and user {}.') -> None:
+        self.service_name = service_name
+        self.db_name = db_name
+        self.username = username
+        self.message = message.format(db_name, username)
+        super().__init__(self.service_name,self.message)
+
 class DatabaseServiceDBNotFoundError(DatabaseServiceException):
     def __init__(self, db_name: str, service_name: str, message = 'DB not found {}.') -> None:
         self.service_name = service_name
@@ -49,6 +49,15 @@ class BenchConfig(BaseModel):
     userid: int = Field(default_factory=os.getuid, description="The user ID of the current process")
     usergroup: int = Field(default_factory=os.getgid, description="The group ID of the current process")
 
+    def __deepcopy__(self, memo: Optional[Dict[int, Any]] = None) -> "BenchConfig":
+        # only ssl (alias_domains and toml_exclude) and apps_list hold mutable values, every other field is immutable
+        ssl_update: Dict[str, Any] = {'alias_domains': list(self.ssl.alias_domains)}
+        if self.ssl.toml_exclude is not None:
+            ssl_update['toml_exclude'] = set(self.ssl.toml_exclude)
+        ssl = self.ssl.model_copy(update=ssl_update)
+        apps_list = [dict(app) for app in self.apps_list]
+        return self.model_copy(update={'ssl': ssl, 'apps_list': apps_list})
+
     @property
     def db_name(self):
         return self.name.replace(".", "-")
@@ -94,7 +103,7 @@ class BenchConfig(BaseModel):
                 toml_doc[key] = value
         try:
             with open(path, 'w') as f:
-                f.write(tomlkit.dumps(toml_doc))
+                tomlkit.dump(toml_doc, f)
             return True
         except Exception as e:
             return False
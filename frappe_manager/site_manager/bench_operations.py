@@ -1,3 +1,4 @@
+import functools
 from collections.abc import Iterable
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
@@ -111,6 +112,7 @@ class BenchOperations:
         workdir="/workspace/frappe-bench",
         service: str = 'frappe',
         compose_project_obj: Optional[ComposeProject] = None,
+        use_container_exec: bool = False,
     ):
 
         if compose_project_obj:
@@ -118,15 +120,22 @@ class BenchOperations:
         else:
             compose_project: ComposeProject = self.bench.compose_project
 
+        if use_container_exec:
+            # exec directly in the service's container, docker compose exec parses the whole compose project first
+            container_name = compose_project.compose_file_manager.get_container_names()[service]
+            exec_command = functools.partial(compose_project.docker.exec, container_name)
+        else:
+            exec_command = functools.partial(compose_project.docker.compose.exec, service=service)
+
         try:
             if capture_output:
-                output: SubprocessOutput = compose_project.docker.compose.exec(
-                    service=service, command=command, user=user, workdir=workdir, stream=not capture_output
+                output: SubprocessOutput = exec_command(
+                    command=command, user=user, workdir=workdir, stream=not capture_output
                 )
                 return output
             else:
-                output: Iterable[Tuple[str, bytes]] = compose_project.docker.compose.exec(
-                    service=service, command=command, workdir=workdir, user=user, stream=not capture_output
+                output: Iterable[Tuple[str, bytes]] = exec_command(
+                    command=command, workdir=workdir, user=user, stream=not capture_output
                 )
                 richprint.live_lines(output)
 
@@ -172,6 +181,7 @@ class BenchOperations:
             )
             self.container_run(bench_setup_supervisor_command, bench_setup_supervisor_exception)
             self.split_supervisor_config()
+            self.bench.save_supervisor_config_fingerprint()
             richprint.print("Configured supervisor configs")
 
     def split_supervisor_config(self):
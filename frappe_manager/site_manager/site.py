@@ -1,16 +1,22 @@
-import copy
+import functools
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import time
-import itertools
-from datetime import datetime
 import shlex
 import shutil
 import json
 import subprocess
+import sys
 from typing import Any, Dict, List, Optional
 from pathlib import Path
 from frappe_manager.site_manager.bench_operations import BenchOperations
 from rich.table import Table
-from frappe_manager.compose_project.compose_project import ComposeProject
+from frappe_manager.compose_project.compose_project import (
+    ComposeProject,
+    get_services_running_status_bulk,
+    run_compose_operations_parallel,
+)
 from frappe_manager.docker_wrapper.DockerException import DockerException
 from frappe_manager.compose_manager.ComposeFile import ComposeFile
 from frappe_manager.display_manager.DisplayManager import richprint
@@ -41,9 +47,9 @@ from frappe_manager.utils.helpers import (
     capture_and_format_exception,
     format_ssl_certificate_time_remaining,
     get_current_fm_version,
-    log_file,
-    get_container_name_prefix,
+    log_file_chunks,
     save_dict_to_file,
+    wait_for_file_changes,
 )
 from frappe_manager.utils.docker import host_run_cp
 from frappe_manager import (
@@ -54,6 +60,31 @@ from frappe_manager import (
 )
 from frappe_manager.utils.site import domain_level, generate_services_table, get_bench_db_connection_info
 
+# lowercased sentinels matched against raw frappe service log lines
+_UPDATING_FILES = b"updating files:"
+_PROGRESS_BAR = b"[=="
+_SUPERVISORD_STARTED = b"info supervisord started with pid"
+
+_CURL_HTTP_CODE_COMMAND = (
+    'curl -s -o /dev/null -w "%{{http_code}}" --max-time {retry} --connect-timeout {retry} {headers} {url}'
+)
+_HTTP_OK_STATUS_CODE = "200"
+
+# max bytes read from one log file before moving on to the next while following logs
+_LOG_CHUNK_SIZE = 1 << 16
+
+
+@functools.lru_cache(maxsize=256)
+def _load_bench_config_cached(bench_config_path: str, mtime_ns: int, size: int) -> BenchConfig:
+    # mtime and size are part of the cache key so that any change to the file triggers a fresh parse
+    return BenchConfig.import_from_toml(Path(bench_config_path))
+
+
+@functools.lru_cache(maxsize=1)
+def _vscode_path() -> Optional[str]:
+    # VSCODE_BIN allows pointing to the binary directly and skips the PATH walk
+    return os.environ.get("VSCODE_BIN") or shutil.which("code")
+
 
 class Bench:
     def __init__(
@@ -86,11 +117,7 @@ class Bench:
         self.benchops = BenchOperations(self)
         self.workers = BenchWorkers(self, not verbose)
 
-        if workers_check:
-            self.ensure_workers_running_if_available()
-
-        if admin_tools_check:
-            self.ensure_admin_tools_running_if_available()
+        self.ensure_aux_services(workers=workers_check, admin_tools=admin_tools_check)
 
     @classmethod
     def get_object(
@@ -112,7 +139,10 @@ class Bench:
         compose_file_manager = ComposeFile(bench_path / "docker-compose.yml")
         compose_project: ComposeProject = ComposeProject(compose_file_manager, verbose=verbose)
 
-        bench_config: BenchConfig = BenchConfig.import_from_toml(bench_config_path)
+        bench_config_stat = bench_config_path.stat()
+        bench_config: BenchConfig = _load_bench_config_cached(
+            str(bench_config_path), bench_config_stat.st_mtime_ns, bench_config_stat.st_size
+        ).model_copy(deep=True)
 
         parms: Dict[str, Any] = {
             'name': bench_name,
@@ -138,15 +168,17 @@ class Bench:
             richprint.print("Certificate Updated.")
 
         # admin tools
+        admin_tools_compose_exists = self.admin_tools.compose_project.compose_file_manager.exists()
+
         if self.bench_config.admin_tools:
-            if not self.admin_tools.compose_project.compose_file_manager.compose_path.exists():
+            if not admin_tools_compose_exists:
                 self.sync_admin_tools_compose()
             else:
                 self.admin_tools.enable(force_configure=True)
             richprint.print("Enabled Admin-tools.")
 
         else:
-            if not self.admin_tools.compose_project.compose_file_manager.compose_path.exists():
+            if not admin_tools_compose_exists:
                 richprint.print("Admin tools is already disabled.")
             else:
                 self.admin_tools.disable()
@@ -165,6 +197,26 @@ class Bench:
     def exists(self):
         return self.path.exists()
 
+    @functools.cached_property
+    def bench_root_path(self) -> Path:
+        return self.path / "workspace" / "frappe-bench"
+
+    @functools.cached_property
+    def logs_dir_path(self) -> Path:
+        return self.bench_root_path / "logs"
+
+    @functools.cached_property
+    def dot_vscode_dir_path(self) -> Path:
+        return self.bench_root_path / ".vscode"
+
+    @functools.cached_property
+    def dev_log_file_paths(self) -> tuple[Path, ...]:
+        return (self.logs_dir_path / "web.dev.log",)
+
+    @functools.cached_property
+    def prod_log_file_paths(self) -> tuple[Path, ...]:
+        return (self.logs_dir_path / "web.error.log", self.logs_dir_path / "web.log")
+
     def create(self, is_template_bench: bool = False):
         """
         Creates a new bench using the provided template inputs.
@@ -297,28 +349,29 @@ class Bench:
         Returns:
             None
         """
-        if "environment" in inputs.keys():
-            environments: dict = inputs["environment"]
-            self.compose_project.compose_file_manager.set_all_envs(environments)
-
-        if "labels" in inputs.keys():
-            labels: dict = inputs["labels"]
-            self.compose_project.compose_file_manager.set_all_labels(labels)
-
-        if "user" in inputs.keys():
-            user: dict = inputs["user"]
-            for container_name in user.keys():
-                uid = user[container_name]["uid"]
-                gid = user[container_name]["gid"]
-                self.compose_project.compose_file_manager.set_user(container_name, uid, gid)
-
-        self.compose_project.compose_file_manager.set_network_alias("nginx", "site-network", [self.name])
-        self.compose_project.compose_file_manager.set_container_names(get_container_name_prefix(self.name))
-        self.compose_project.compose_file_manager.set_version(get_current_fm_version())
-        self.compose_project.compose_file_manager.set_top_networks_name(
-            "site-network", get_container_name_prefix(self.name)
-        )
-        self.compose_project.compose_file_manager.write_to_file()
+        compose_file_manager = self.compose_project.compose_file_manager
+
+        with compose_file_manager.batch_edit():
+            if "environment" in inputs.keys():
+                environments: dict = inputs["environment"]
+                compose_file_manager.set_all_envs(environments)
+
+            if "labels" in inputs.keys():
+                labels: dict = inputs["labels"]
+                compose_file_manager.set_all_labels(labels)
+
+            if "user" in inputs.keys():
+                user: dict = inputs["user"]
+                for container_name in user.keys():
+                    uid = user[container_name]["uid"]
+                    gid = user[container_name]["gid"]
+                    compose_file_manager.set_user(container_name, uid, gid)
+
+            compose_file_manager.set_network_alias("nginx", "site-network", [self.name])
+            compose_file_manager.set_container_names(self.bench_config.container_name_prefix)
+            compose_file_manager.set_version(get_current_fm_version())
+            compose_file_manager.set_top_networks_name("site-network", self.bench_config.container_name_prefix)
+            compose_file_manager.write_to_file()
 
     def sync_bench_common_site_config(self, services_db_host: str, services_db_port: int):
         """
@@ -327,7 +380,7 @@ class Bench:
         This function sets the common site configuration data including the socketio port, database host and port,
         and the Redis cache, queue, and socketio URLs.
         """
-        container_prefix = get_container_name_prefix(self.name)
+        container_prefix = self.bench_config.container_name_prefix
 
         # set common site config
         common_site_config_data = {
@@ -349,17 +402,15 @@ class Bench:
         """
         richprint.change_head("Creating required directories")
 
-        frappe_image = self.compose_project.compose_file_manager.yml["services"]["frappe"]["image"]
+        services_yml = self.compose_project.compose_file_manager.yml["services"]
+        frappe_image = services_yml["frappe"]["image"]
+        nginx_image = services_yml["nginx"]["image"]
 
         workspace_path = self.path / "workspace"
         workspace_path_abs = str(workspace_path.absolute())
 
-        host_run_cp(
-            frappe_image,
-            source="/workspace",
-            destination=workspace_path_abs,
-            docker=self.compose_project.docker,
-        )
+        # image, source, destination
+        copy_operations = [(frappe_image, "/workspace", workspace_path_abs)]
 
         configs_path = self.path / "configs"
         configs_path.mkdir(parents=True, exist_ok=True)
@@ -369,24 +420,34 @@ class Bench:
         nginx_dir.mkdir(parents=True, exist_ok=True)
 
         nginx_poluate_dir = ["conf"]
-        nginx_image = self.compose_project.compose_file_manager.yml["services"]["nginx"]["image"]
 
         for directory in nginx_poluate_dir:
             new_dir = nginx_dir / directory
             if not new_dir.exists():
                 new_dir_abs = str(new_dir.absolute())
-                host_run_cp(
-                    nginx_image,
-                    source="/etc/nginx",
-                    destination=new_dir_abs,
+                copy_operations.append((nginx_image, "/etc/nginx", new_dir_abs))
+
+        # every copy runs its own transient container, so run them concurrently
+        with ThreadPoolExecutor(max_workers=len(copy_operations)) as executor:
+            futures = [
+                executor.submit(
+                    host_run_cp,
+                    image,
+                    source=source,
+                    destination=destination,
                     docker=self.compose_project.docker,
                 )
+                for image, source, destination in copy_operations
+            ]
 
-        nginx_subdirs = ["logs", "cache", "run", "html"]
+            nginx_subdirs = ["logs", "cache", "run", "html"]
 
-        for directory in nginx_subdirs:
-            new_dir = nginx_dir / directory
-            new_dir.mkdir(parents=True, exist_ok=True)
+            for directory in nginx_subdirs:
+                new_dir = nginx_dir / directory
+                new_dir.mkdir(parents=True, exist_ok=True)
+
+            for future in as_completed(futures):
+                future.result()
 
         richprint.print("Created all required directories.")
 
@@ -407,7 +468,7 @@ class Bench:
         self.admin_tools.remove_nginx_location_config()
         self.compose_project.start_service(force_recreate=force)
         self.benchops.is_required_services_available()
-        self.sync_workers_compose()
+        self.sync_workers_compose(force_supervisor=force)
         self.sync_bench_config_configuration()
         self.save_bench_config()
         richprint.print("Started bench services.")
@@ -437,20 +498,19 @@ class Bench:
             richprint.live_lines(
                 output,
                 padding=(0, 0, 0, 2),
-                stop_string="INFO supervisord started with pid",
+                stop_string=_SUPERVISORD_STARTED.decode(),
             )
         else:
             for source, line in output:
                 if not source == "exit_code":
-                    line = line.decode()
+                    lowered_line = line.lower()
 
-                    if "Updating files:".lower() in line.lower():
-                        continue
-                    if "[==".lower() in line.lower():
-                        print(line)
+                    if _UPDATING_FILES in lowered_line or _PROGRESS_BAR in lowered_line:
                         continue
-                    richprint.stdout.print(line)
-                    if "INFO supervisord started with pid".lower() in line.lower():
+
+                    richprint.stdout.print(line.decode())
+
+                    if _SUPERVISORD_STARTED in lowered_line:
                         break
 
     def stop(self) -> bool:
@@ -460,19 +520,26 @@ class Bench:
         Returns:
             bool: True if the site is successfully stopped, False otherwise.
         """
+        workers_compose_exists = self.workers.compose_project.compose_file_manager.exists()
+        admin_tools_compose_exists = self.admin_tools.compose_project.compose_file_manager.exists()
+
+        # bench, workers and admin tools are independent compose projects so stop them concurrently
+        stop_operations = [(self.compose_project, self.compose_project.stop_service)]
+
+        if workers_compose_exists:
+            stop_operations.append((self.workers.compose_project, self.workers.compose_project.stop_service))
+
+        if admin_tools_compose_exists:
+            stop_operations.append((self.admin_tools.compose_project, self.admin_tools.compose_project.stop_service))
+
         richprint.change_head("Stopping bench services")
-        self.compose_project.stop_service()
+        run_compose_operations_parallel(stop_operations)
         richprint.print("Stopped bench services.")
 
-        if self.workers.compose_project.compose_file_manager.exists():
-            richprint.change_head("Starting bench workers services")
-            self.workers.compose_project.stop_service()
-            richprint.print("Started bench workers services")
+        if workers_compose_exists:
+            richprint.print("Stopped bench workers services.")
 
-        # stop admin_tools if exists
-        if self.admin_tools.compose_project.compose_file_manager.exists():
-            richprint.change_head("Stopped bench admin tools services")
-            self.admin_tools.compose_project.stop_service()
+        if admin_tools_compose_exists:
             richprint.print("Stopped bench admin tools services.")
 
     def remove_containers_and_dirs(self):
@@ -484,26 +551,31 @@ class Bench:
             bool: True if the site is successfully removed, False otherwise.
         """
         # TODO handle low level errors like read only, write only, etc.
-        if self.compose_project.compose_file_manager.exists():
-            richprint.change_head("Removing bench containers.")
-            self.compose_project.down_service(remove_ophans=True, volumes=True)
-            richprint.print("Removed bench containers.")
-        else:
-            richprint.warning('Bench compose file not found. Skipping containers removal.')
+        compose_projects = {
+            'bench': self.compose_project,
+            'bench workers': self.workers.compose_project,
+            'bench admin tools': self.admin_tools.compose_project,
+        }
 
-        if self.workers.compose_project.compose_file_manager.exists():
-            richprint.change_head("Removing bench workers containers.")
-            self.workers.compose_project.down_service(remove_ophans=True, volumes=True)
-            richprint.print("Removed bench workers containers.")
-        else:
-            richprint.warning('Bench workers compose file not found. Skipping containers removal.')
+        remove_operations = []
+        removed_compose_projects = []
 
-        if self.admin_tools.compose_project.compose_file_manager.exists():
-            richprint.change_head("Removing bench admin tools containers.")
-            self.admin_tools.compose_project.down_service(remove_ophans=True, volumes=True)
-            richprint.print("Removed bench admin tools containers.")
-        else:
-            richprint.warning('Bench admin tools compose file not found. Skipping containers removal.')
+        for project_name, compose_project in compose_projects.items():
+            if not compose_project.compose_file_manager.exists():
+                richprint.warning(f'{project_name.capitalize()} compose file not found. Skipping containers removal.')
+                continue
+
+            remove_operations.append(
+                (compose_project, functools.partial(compose_project.down_service, remove_ophans=True, volumes=True))
+            )
+            removed_compose_projects.append(project_name)
+
+        if remove_operations:
+            richprint.change_head("Removing bench containers.")
+            run_compose_operations_parallel(remove_operations)
+
+            for project_name in removed_compose_projects:
+                richprint.print(f"Removed {project_name} containers.")
 
         richprint.change_head("Removing all bench files and directories.")
         try:
@@ -514,10 +586,12 @@ class Bench:
                 if "frappe" in images:
                     frappe_image = images["frappe"]
                     frappe_image = f"{frappe_image['name']}:{frappe_image['tag']}"
+                    # remove the workspace from inside the container in a single pass instead of
+                    # chowning it first and then walking it again from the host
                     self.compose_project.docker.run(
                         image=frappe_image,
                         entrypoint="/bin/sh",
-                        command="-c 'chown -R frappe:frappe .'",
+                        command="-c 'rm -rf /workspace/..?* /workspace/.[!.]* /workspace/*'",
                         volume=f"{self.path}/workspace:/workspace",
                         stream=False,
                     )
@@ -528,36 +602,77 @@ class Bench:
         richprint.print("Removed all bench files and directories.")
 
     def is_bench_created(self, retry=60, interval=1) -> bool:
-        curl_command = 'curl -I --max-time {retry} --connect-timeout {retry} {headers} {url}'
         url = 'http://localhost'
         headers = ''
         if self.bench_config.environment_type == FMBenchEnvType.prod:
-            headers = f"-H 'Host: {self.name}'"
+            headers = f"-H {shlex.quote(f'Host: {self.name}')}"
 
-        check_command = curl_command.format(retry=retry, headers=headers, url=url)
+        check_command = _CURL_HTTP_CODE_COMMAND.format(retry=retry, headers=headers, url=url)
 
-        for _ in range(retry):
-            try:
-                # Execute curl command on frappe service
-                result = self.compose_project.docker.compose.exec(
-                    service="frappe",
-                    command=check_command,
-                    stream=False,
-                )
-                for line in result.stdout:
-                    if 'HTTP/1.1 200 OK' in line:
-                        return True
-            except Exception:
-                time.sleep(interval)
-        return False
+        # retry inside the frappe service so that only a single exec is spawned
+        retry_check_command = (
+            f'i=0; while [ $i -lt {retry} ]; do '
+            f'[ "$({check_command})" = "{_HTTP_OK_STATUS_CODE}" ] && exit 0; '
+            f'i=$((i+1)); sleep {interval}; '
+            'done; exit 1'
+        )
+
+        try:
+            self.compose_project.docker.compose.exec(
+                service="frappe",
+                command=f"sh -c {shlex.quote(retry_check_command)}",
+                stream=False,
+            )
+            return True
+        except DockerException:
+            return False
 
-    def sync_workers_compose(self, force_recreate: bool = False, setup_supervisor: bool = True):
+    def get_supervisor_config_fingerprint(self) -> str:
+        """
+        Returns a fingerprint of the bench files the supervisor configuration is generated from.
+        """
+        sites_path = self.bench_root_path / "sites"
+        fingerprint = hashlib.sha256()
+
+        # a new fm version may ship a new frappe image or change how the supervisor config is split
+        fingerprint.update(get_current_fm_version().encode())
+        fingerprint.update(b"\0")
+
+        for file_path in [sites_path / "apps.json", sites_path / "apps.txt", sites_path / "common_site_config.json"]:
+            if file_path.exists():
+                fingerprint.update(file_path.read_bytes())
+            fingerprint.update(b"\0")
+
+        return fingerprint.hexdigest()
+
+    def is_supervisor_config_changed(self, fingerprint: str) -> bool:
+        if not self.workers.supervisor_config_path.exists():
+            return True
+
+        if not self.workers.is_workers_supervisor_config_available():
+            return True
+
+        if not self.workers.supervisor_config_fingerprint_path.exists():
+            return True
+
+        return not self.workers.supervisor_config_fingerprint_path.read_text() == fingerprint
+
+    def save_supervisor_config_fingerprint(self):
+        self.workers.supervisor_config_fingerprint_path.write_text(self.get_supervisor_config_fingerprint())
+
+    def sync_workers_compose(
+        self, force_recreate: bool = False, setup_supervisor: bool = True, force_supervisor: bool = False
+    ):
         if setup_supervisor:
-            workers_backup_manager = self.backup_workers_supervisor_conf()
-            try:
-                self.benchops.setup_supervisor(force=True)
-            except BenchOperationException as e:
-                self.backup_restore_workers_supervisor(workers_backup_manager)
+            # bench setup supervisor is costly, skip it if none of its inputs changed since last run
+            if not force_supervisor and not self.is_supervisor_config_changed(self.get_supervisor_config_fingerprint()):
+                richprint.print("Supervisor configuration remains unchanged.")
+            else:
+                workers_backup_manager = self.backup_workers_supervisor_conf()
+                try:
+                    self.benchops.setup_supervisor(force=True)
+                except BenchOperationException as e:
+                    self.backup_restore_workers_supervisor(workers_backup_manager)
 
         are_workers_not_changed = self.workers.is_new_workers_added()
 
@@ -578,21 +693,21 @@ class Bench:
         backup_workers_manager.backup(self.workers.supervisor_config_path, bench_name=self.name)
 
         if self.workers.supervisor_config_path.exists():
-            for file_path in self.workers.config_dir.iterdir():
-                file_path_abs = str(file_path.absolute())
-                if not file_path.is_file():
-                    continue
-                if file_path_abs.endswith(".fm.supervisor.conf"):
-                    from_path = file_path
-                    backup_workers_manager.backup(from_path, bench_name=self.name)
-                    file_path.unlink()
+            with os.scandir(self.workers.config_dir) as config_dir_entries:
+                for entry in config_dir_entries:
+                    if not entry.is_file():
+                        continue
+                    if entry.name.endswith(".fm.supervisor.conf"):
+                        from_path = Path(entry.path)
+                        backup_workers_manager.backup(from_path, bench_name=self.name)
+                        from_path.unlink()
         return backup_workers_manager
 
     def regenerate_workers_supervisor_conf(self):
         self.backup_workers_supervisor_conf()
 
     def get_bench_installed_apps_list(self):
-        apps_json_file = self.path / "workspace" / "frappe-bench" / "sites" / "apps.json"
+        apps_json_file = self.bench_root_path / "sites" / "apps.json"
         apps_data: dict = {}
         if not apps_json_file.exists():
             return {}
@@ -645,25 +760,25 @@ class Bench:
 
         self.certificate_manager.renew_certificate()
 
-    def info(self):
+    def get_info_data(self) -> Dict[str, Any]:
         """
-        Retrieves and displays information about the bench.
+        Retrieves information about the bench as plain data.
 
-        This method retrieves various information about the site, such as site URL, site root, database details,
-        Frappe username and password, root database user and password, and more. It then formats and displays
-        this information using the richprint library.
-        """
+        Unlike info, this neither builds rich tables nor queries docker for the services status.
 
-        richprint.change_head("Getting bench info")
+        Returns:
+            Dict[str, Any]: Bench info, admin tools urls are given as a dict if admin tools are enabled.
+        """
         bench_db_info = self.get_db_connection_info()
 
         db_user = bench_db_info["name"]
         db_pass = bench_db_info["password"]
 
         services_db_info = self.services.database_manager.database_server_info
-        bench_info_table = Table(show_lines=True, show_header=False, highlight=True)
 
-        protocol = 'https' if self.has_certificate() else 'http'
+        has_certificate = self.has_certificate()
+
+        protocol = 'https' if has_certificate else 'http'
 
         # get admin pass from site_config.json if available use that
         admin_pass = self.bench_config.admin_pass + " (default)"
@@ -682,7 +797,7 @@ class Bench:
 
         data = {
             "Bench Url": f"{protocol}://{self.name}",
-            "Bench Root": f"[link=file://{self.path.absolute()}]{self.path.absolute()}[/link]",
+            "Bench Root": str(self.path.absolute()),
             "Frappe Username": "administrator",
             "Frappe Password": admin_pass,
             "Root DB User": services_db_info.user,
@@ -694,7 +809,7 @@ class Bench:
             "Environment": self.bench_config.environment_type.value,
             "HTTPS": (
                 f'{ssl_service_type.upper()} ({format_ssl_certificate_time_remaining(self.certificate_manager.get_certficate_expiry())})'
-                if self.has_certificate()
+                if has_certificate
                 else 'Not Enabled'
             ),
         }
@@ -702,18 +817,43 @@ class Bench:
         if not self.bench_config.admin_tools:
             data['Admin Tools'] = 'Not Enabled'
         else:
+            data['Admin Tools'] = {
+                "Mailhog": f"{protocol}://{self.name}/mailhog",
+                "Adminer": f"{protocol}://{self.name}/adminer",
+            }
+
+        return data
+
+    def info(self):
+        """
+        Retrieves and displays information about the bench.
+
+        This method retrieves various information about the site, such as site URL, site root, database details,
+        Frappe username and password, root database user and password, and more. It then formats and displays
+        this information using the richprint library.
+        """
+
+        richprint.change_head("Getting bench info")
+        data = self.get_info_data()
+
+        bench_info_table = Table(show_lines=True, show_header=False, highlight=True)
+
+        bench_root_path = data["Bench Root"]
+        data["Bench Root"] = f"[link=file://{bench_root_path}]{bench_root_path}[/link]"
+
+        if isinstance(data['Admin Tools'], dict):
             admin_tools_Table = Table(show_lines=True, show_edge=False, pad_edge=False, expand=True)
             admin_tools_Table.add_column("Tool")
             admin_tools_Table.add_column("URL")
-            admin_tools_Table.add_row("Mailhog", f"{protocol}://{self.name}/mailhog")
-            admin_tools_Table.add_row("Adminer", f"{protocol}://{self.name}/adminer")
+            for tool, url in data['Admin Tools'].items():
+                admin_tools_Table.add_row(tool, url)
             data['Admin Tools'] = admin_tools_Table
 
         bench_info_table.add_column(no_wrap=True)
         bench_info_table.add_column(no_wrap=True)
 
-        for key in data.keys():
-            bench_info_table.add_row(key, data[key])
+        for key, value in data.items():
+            bench_info_table.add_row(key, value)
 
         # get bench apps data
         apps_json = self.get_bench_installed_apps_list()
@@ -724,14 +864,16 @@ class Bench:
             bench_apps_list_table.add_column("App")
             bench_apps_list_table.add_column("Version")
 
-            for app in apps_json.keys():
-                bench_apps_list_table.add_row(app, apps_json[app]["version"])
+            for app, app_info in apps_json.items():
+                bench_apps_list_table.add_row(app, app_info["version"])
 
             bench_info_table.add_row("Bench Apps", bench_apps_list_table)
 
-        running_bench_services = self.compose_project.get_services_running_status()
-        running_bench_workers = self.workers.compose_project.get_services_running_status()
-        running_bench_admin_tools = self.admin_tools.compose_project.get_services_running_status()
+        # all bench compose projects share the container name prefix so get their status in one docker call
+        running_bench_services, running_bench_workers, running_bench_admin_tools = get_services_running_status_bulk(
+            [self.compose_project, self.workers.compose_project, self.admin_tools.compose_project],
+            self.bench_config.container_name_prefix,
+        )
 
         if running_bench_services:
             bench_services_table = generate_services_table(running_bench_services)
@@ -790,14 +932,10 @@ class Bench:
             richprint.warning(f"Shell exited with error code: {e.output.exit_code}")
 
     def get_log_file_paths(self):
-        base_log_dir = self.path / "workspace" / "frappe-bench" / "logs"
         if self.bench_config.environment_type == FMBenchEnvType.dev:
-            bench_dev_server_log_path = base_log_dir / "web.dev.log"
-            return [bench_dev_server_log_path]
+            return list(self.dev_log_file_paths)
         else:
-            bench_prod_server_log_path_stdout = base_log_dir / "web.log"
-            bench_prod_server_log_path_stderr = base_log_dir / "web.error.log"
-            return [bench_prod_server_log_path_stderr, bench_prod_server_log_path_stdout]
+            return list(self.prod_log_file_paths)
 
     def handle_frappe_server_file_logs(self, follow: bool):
         log_generators = []
@@ -813,22 +951,55 @@ class Bench:
                 richprint.print("[yellow]No log files found.[/yellow]")
                 return
 
-            # Open log files and create generators
+            if not follow:
+                # skip opening empty log files
+                log_file_paths = [path for path in log_file_paths if path.exists() and path.stat().st_size > 0]
+
+                if not log_file_paths:
+                    richprint.print("[yellow]Log files are empty.[/yellow]")
+                    return
+
+                # raw bytes bypass rich's stdout proxy, stop the live display so the spinner doesn't mix with the logs
+                richprint.stop()
+
+                # stream each log file as is in 64 KB blocks, no need to split it into lines
+                stdout = sys.stdout.buffer
+                for path in log_file_paths:
+                    with open(path, 'rb') as log:
+                        shutil.copyfileobj(log, stdout, 1 << 16)
+                stdout.flush()
+                return
+
+            # Create generators reading the log files in chunks of complete lines
             for path in log_file_paths:
-                log_generators.append(log_file(open(path, 'r'), follow=follow))
-
-            if follow:
-                while True:
-                    try:
-                        for line in itertools.chain.from_iterable(log_generators):
-                            print(line.strip())
-                    except StopIteration:
-                        time.sleep(0.1)
-            else:
-                for lines in itertools.zip_longest(*log_generators, fillvalue=""):
-                    for line in lines:
-                        if line:
-                            print(line.strip())
+                log_generators.append(log_file_chunks(path, max_chunk_size=_LOG_CHUNK_SIZE))
+
+            # raw bytes bypass rich's stdout proxy, stop the live display so the spinner doesn't mix with the logs
+            richprint.stop()
+
+            write = sys.stdout.buffer.write
+            flush = sys.stdout.buffer.flush
+            file_changes = wait_for_file_changes(log_file_paths)
+            try:
+                for _ in file_changes:
+                    # drain the files in rounds of one bounded chunk per file so that a busy log file can't starve
+                    # the others, until every file has caught up
+                    caught_up = False
+                    while not caught_up:
+                        caught_up = True
+                        # batch the chunks of each round into a single write
+                        output = []
+                        for log_generator in log_generators:
+                            # log_file_chunks yields None once it has caught up with the file
+                            chunk = next(log_generator)
+                            if chunk is not None:
+                                output.append(chunk)
+                                caught_up = False
+                        if output:
+                            write(b"".join(output))
+                            flush()
+            finally:
+                file_changes.close()
 
         finally:
             for logfile in log_generators:
@@ -869,7 +1040,7 @@ class Bench:
             raise BenchNotRunning(self.name)
 
         # check if vscode is installed
-        vscode_path = shutil.which("code")
+        vscode_path = _vscode_path()
 
         if not vscode_path:
             # TODO todo this should be exception
@@ -878,42 +1049,42 @@ class Bench:
         container_name = self.compose_project.compose_file_manager.get_container_names()
         container_hex = container_name["frappe"].encode().hex()
 
-        vscode_cmd = shlex.join(
-            [
-                vscode_path,
-                f"--folder-uri=vscode-remote://attached-container+{container_hex}+{workdir}",
-            ]
-        )
+        vscode_cmd = [
+            vscode_path,
+            f"--folder-uri=vscode-remote://attached-container+{container_hex}+{workdir}",
+        ]
 
-        extensions.sort()
+        # don't mutate the caller's list, and skip sorting when it's already sorted
+        if not all(a <= b for a, b in zip(extensions, extensions[1:])):
+            extensions = sorted(extensions)
 
-        vscode_config_without_extension = [
+        vscode_config_json = [
             {
                 "remoteUser": user,
                 "remoteEnv": {"SHELL": "/bin/zsh"},
                 "customizations": {
                     "vscode": {
                         "settings": VSCODE_SETTINGS_JSON,
+                        "extensions": extensions,
                     }
                 },
             }
         ]
 
-        vscode_config_json = copy.deepcopy(vscode_config_without_extension)
-        vscode_config_json[0]['customizations']['vscode']["extensions"] = extensions
-
-        labels = {'devcontainer.metadata': json.dumps(vscode_config_json)}
-
         try:
-            labels_previous = self.compose_project.compose_file_manager.get_labels("frappe")[0]
-            labels_previous = json.loads(labels_previous["devcontainer.metadata"])
-            extensions_previous = copy.deepcopy(labels_previous["customizations"]["vscode"]["extensions"])
+            labels_previous = self.compose_project.compose_file_manager.get_labels("frappe")
+            vscode_config_previous = json.loads(labels_previous["devcontainer.metadata"])[0]
+            extensions_previous = vscode_config_previous["customizations"]["vscode"]["extensions"]
+            user_previous = vscode_config_previous.get("remoteUser")
 
-        except KeyError:
+        except (KeyError, IndexError, TypeError, json.JSONDecodeError):
             extensions_previous = []
+            user_previous = None
 
-        if not extensions_previous == extensions or not user == user:
+        if len(extensions_previous) != len(extensions) or extensions_previous != extensions or user_previous != user:
             richprint.change_head("Configuration changed, regenerating label in bench compose")
+            # only serialize the label when it has to be written
+            labels = {'devcontainer.metadata': json.dumps(vscode_config_json)}
             self.compose_project.compose_file_manager.set_labels("frappe", labels)
             self.compose_project.compose_file_manager.write_to_file()
             richprint.print("Regenerated bench compose.")
@@ -923,7 +1094,7 @@ class Bench:
         # sync debugger files
         if debugger:
             richprint.change_head("Sync vscode debugger configuration")
-            dot_vscode_dir = self.path / "workspace" / "frappe-bench" / ".vscode"
+            dot_vscode_dir = self.dot_vscode_dir_path
             tasks_json_path = dot_vscode_dir / "tasks"
             launch_json_path = dot_vscode_dir / "launch"
             setting_json_path = dot_vscode_dir / "settings"
@@ -937,18 +1108,23 @@ class Bench:
             if not dot_vscode_dir.exists():
                 dot_vscode_dir.mkdir(exist_ok=True, parents=True)
 
+            # same timestamp for all the backups of this sync
+            backup_suffix = time.strftime('%d-%b-%y--%H-%M-%S')
+
             for file_path in [launch_json_path, tasks_json_path, setting_json_path]:
                 file_name = f"{file_path.name}.json"
                 real_file_path = file_path.parent / file_name
+
                 if real_file_path.exists():
-                    backup_tasks_path = (
-                        file_path.parent / f"{file_path.name}.{datetime.now().strftime('%d-%b-%y--%H-%M-%S')}.json"
-                    )
-                    shutil.copy2(real_file_path, backup_tasks_path)
+                    backup_tasks_path = file_path.parent / f"{file_path.name}.{backup_suffix}.json"
+                    # the file is rewritten anyway, so move it to the backup path instead of copying it
+                    os.rename(real_file_path, backup_tasks_path)
                     richprint.print(f"Backup previous '{file_name}' : {backup_tasks_path}")
 
-                with open(real_file_path, "w+") as f:
-                    f.write(json.dumps(dot_vscode_config[file_path]))
+                # serialize straight into the file, its buffer is flushed with a single write on close
+                fd = os.open(real_file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                with open(fd, "w") as f:
+                    json.dump(dot_vscode_config[file_path], f)
 
             # install black in env
             try:
@@ -965,7 +1141,7 @@ class Bench:
             richprint.print("Synced vscode debugger configuration.")
 
         richprint.change_head("Attaching to Container")
-        output = subprocess.run(vscode_cmd, shell=True)
+        output = subprocess.run(vscode_cmd, shell=False)
 
         if output.returncode != 0:
             raise BenchAttachTocontainerFailed(self.name, 'frappe')
@@ -983,16 +1159,16 @@ class Bench:
             db_name = bench_db_info["name"]
             db_user = bench_db_info["user"]
 
-            if not self.services.database_manager.check_db_exists(db_name):
+            db_existed, user_existed = self.services.database_manager.drop_db_and_user(db_name, db_user)
+
+            if not db_existed:
                 richprint.warning(f"Bench db [blue]{db_name}[/blue] not found. Skipping...")
             else:
-                self.services.database_manager.remove_db(db_name)
                 richprint.print(f"Removed bench db [blue]{db_name}[/blue].")
 
-            if not self.services.database_manager.check_user_exists(db_user):
+            if not user_existed:
                 richprint.warning(f"Bench db user [blue]{db_user}[/blue] not found. Skipping...")
             else:
-                self.services.database_manager.remove_user(db_user, remove_all_host=True)
                 richprint.print(f"Removed bench db users [blue]{db_user}[/blue].")
 
     def remove_bench(self, default_choice: bool = True):
@@ -1024,6 +1200,43 @@ class Bench:
         self.remove_containers_and_dirs()
         return True
 
+    def ensure_aux_services(self, workers: bool = True, admin_tools: bool = True):
+        """
+        Ensures the workers and admin tools are in their expected state.
+
+        The docker status probes of the bench, workers and admin tools are run concurrently, starting or stopping
+        services is then done on the calling thread since it renders output.
+
+        Args:
+            workers (bool, optional): Ensure workers are running if available. Defaults to True.
+            admin_tools (bool, optional): Ensure admin tools state matches the bench config. Defaults to True.
+        """
+        workers = workers and self.workers.compose_project.compose_file_manager.exists()
+        admin_tools = admin_tools and self.admin_tools.compose_project.compose_file_manager.exists()
+
+        if not workers and not admin_tools:
+            return
+
+        compose_projects = [self.compose_project]
+
+        if workers:
+            compose_projects.append(self.workers.compose_project)
+
+        if admin_tools:
+            compose_projects.append(self.admin_tools.compose_project)
+
+        # warm the status snapshots, the ensure checks below are answered from them
+        with ThreadPoolExecutor(max_workers=len(compose_projects)) as executor:
+            futures = [executor.submit(compose_project.status_snapshot) for compose_project in compose_projects]
+            for future in as_completed(futures):
+                future.result()
+
+        if workers:
+            self.ensure_workers_running_if_available()
+
+        if admin_tools:
+            self.ensure_admin_tools_running_if_available()
+
     def ensure_workers_running_if_available(self):
         if self.workers.compose_project.compose_file_manager.exists():
             if not self.workers.compose_project.running:
@@ -1037,14 +1250,8 @@ class Bench:
                     if self.compose_project.running:
                         self.admin_tools.enable()
             else:
-                atleast_one_service_running = False
-
-                running_services = self.admin_tools.compose_project.get_services_running_status()
-                for service in running_services:
-                    if service == 'running':
-                        atleast_one_service_running = True
-
-                if atleast_one_service_running:
+                running_services = self.admin_tools.compose_project.status_snapshot()
+                if any(status == 'running' for status in running_services.values()):
                     self.admin_tools.disable()
 
     def sync_admin_tools_compose(self):
@@ -1060,7 +1267,7 @@ class Bench:
 
     def get_apps_dev_requirements(self) -> List[str]:
         """Parse pip requirement string to package name and version"""
-        apps_path = self.path / 'workspace' / 'frappe-bench' / 'apps'
+        apps_path = self.bench_root_path / 'apps'
         apps_path = apps_path.absolute()
 
         pattern = '**/pyproject.toml'
@@ -1109,50 +1316,32 @@ class Bench:
 
         if self.bench_config.environment_type == FMBenchEnvType.dev:
             self.install_dev_packages()
-            richprint.change_head(f"Configuring and starting {self.bench_config.environment_type.value} services")
-            stop_command = 'supervisorctl -c /opt/user/supervisord.conf stop all'
-            self.frappe_service_run_command(stop_command)
-
             unlink_command = 'rm -rf /opt/user/conf.d/frappe-bench-frappe-web.fm.supervisor.conf'
-            self.frappe_service_run_command(unlink_command)
-
             link_command = 'ln -sfn /opt/user/frappe-dev.conf /opt/user/conf.d/frappe-dev.conf'
-            self.frappe_service_run_command(link_command)
-
-            reread_command = 'supervisorctl -c /opt/user/supervisord.conf reread'
-            self.frappe_service_run_command(reread_command)
-
-            update_command = 'supervisorctl -c /opt/user/supervisord.conf update'
-            self.frappe_service_run_command(update_command)
-
-            start_command = 'supervisorctl -c /opt/user/supervisord.conf start all'
-            self.frappe_service_run_command(start_command)
-
-            richprint.print(f"Configured and Started {self.bench_config.environment_type.value} services.")
 
         elif self.bench_config.environment_type == FMBenchEnvType.prod:
             self.remove_dev_packages()
-            richprint.change_head(f"Configuring and starting {self.bench_config.environment_type.value} services")
-            stop_command = 'supervisorctl -c /opt/user/supervisord.conf stop all'
-
-            self.frappe_service_run_command(stop_command)
-
             unlink_command = 'rm -rf /opt/user/conf.d/frappe-dev.conf'
-            self.frappe_service_run_command(unlink_command)
-
             link_command = 'ln -sfn /workspace/frappe-bench/config/frappe-bench-frappe-web.fm.supervisor.conf /opt/user/conf.d/frappe-bench-frappe-web.fm.supervisor.conf'
-            self.frappe_service_run_command(link_command)
 
-            reread_command = 'supervisorctl -c /opt/user/supervisord.conf reread'
-            self.frappe_service_run_command(reread_command)
+        else:
+            return
 
-            update_command = 'supervisorctl -c /opt/user/supervisord.conf update'
-            self.frappe_service_run_command(update_command)
+        richprint.change_head(f"Configuring and starting {self.bench_config.environment_type.value} services")
+
+        switch_env_commands = [
+            'supervisorctl -c /opt/user/supervisord.conf stop all',
+            unlink_command,
+            link_command,
+            'supervisorctl -c /opt/user/supervisord.conf reread',
+            'supervisorctl -c /opt/user/supervisord.conf update',
+            'supervisorctl -c /opt/user/supervisord.conf start all',
+        ]
 
-            start_command = 'supervisorctl -c /opt/user/supervisord.conf start all'
-            self.frappe_service_run_command(start_command)
+        # run all the commands in a single exec since they are strictly sequential
+        self.frappe_service_run_command(f"sh -c {shlex.quote(' && '.join(switch_env_commands))}")
 
-            richprint.print(f"Configured and Started {self.bench_config.environment_type.value} services.")
+        richprint.print(f"Configured and Started {self.bench_config.environment_type.value} services.")
 
     def is_supervisord_running(self, interval: int = 2, timeout: int = 30):
         for i in range(timeout):
@@ -1211,6 +1400,7 @@ class Bench:
             raise_exception_obj=exception,
             service=service,
             compose_project_obj=compose_project_obj,
+            use_container_exec=True,
         )
         return True
 
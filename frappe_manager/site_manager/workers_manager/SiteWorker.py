@@ -1,3 +1,4 @@
+import os
 from copy import deepcopy
 from pathlib import Path
 from typing import List, TYPE_CHECKING
@@ -17,21 +18,31 @@ class BenchWorkers:
         self.compose_path = self.bench.path / "docker-compose.workers.yml"
         self.config_dir = self.bench.path / "workspace" / "frappe-bench" / "config"
         self.supervisor_config_path = self.config_dir / "supervisor.conf"
+        self.supervisor_config_fingerprint_path = self.config_dir / ".supervisor.conf.fm.fingerprint"
         self.quiet = not verbose
         self.compose_project = ComposeProject(
             ComposeFile(self.compose_path, template_name='docker-compose.workers.tmpl')
         )
 
+    def is_workers_supervisor_config_available(self) -> bool:
+        if not self.config_dir.exists():
+            return False
+
+        with os.scandir(self.config_dir) as config_dir_entries:
+            return any(
+                entry.is_file() and entry.name.endswith(".workers.fm.supervisor.conf") for entry in config_dir_entries
+            )
+
     def get_expected_workers(self) -> List[str]:
         richprint.change_head("Checking workers info.")
 
         workers_supervisor_conf_paths = []
 
-        for file_path in self.config_dir.iterdir():
-            file_path_abs = str(file_path.absolute())
-            if file_path.is_file():
-                if file_path_abs.endswith(".workers.fm.supervisor.conf"):
-                    workers_supervisor_conf_paths.append(file_path)
+        with os.scandir(self.config_dir) as config_dir_entries:
+            for entry in config_dir_entries:
+                if entry.is_file():
+                    if entry.name.endswith(".workers.fm.supervisor.conf"):
+                        workers_supervisor_conf_paths.append(Path(entry.path))
 
         if len(workers_supervisor_conf_paths) == 0:
             raise BenchWorkersSupervisorConfigurtionNotFoundError(self.bench.name, self.config_dir)
@@ -81,8 +92,6 @@ class BenchWorkers:
 
         workers_expected_service_names = self.get_expected_workers()
 
-        import os
-
         for worker in workers_expected_service_names:
             worker_config = deepcopy(template_worker_config)
 
@@ -1,5 +1,10 @@
+import ctypes
+import ctypes.util
 import importlib
 import json
+import mmap
+import os
+import selectors
 from cryptography.hazmat.backends import default_backend
 from datetime import datetime
 from cryptography import x509
@@ -246,32 +251,176 @@ def represent_null_empty(string_null):
     return string_null.replace("null", "")
 
 
-def log_file(file, refresh_time: float = 0.1, follow: bool = False):
+def log_file_chunks(file_path: Path, max_chunk_size: int = 1 << 16):
     """
-    Generator function that yields new lines in a file
+    Generator function that yields the complete lines added to a file as bytes chunks, read through mmap.
 
     Parameters:
-    - file: The file object to read from
-    - refresh_time: The time interval (in seconds) to wait before checking for new lines in the file (default: 0.1)
-    - follow: If True, the function will continue to yield new lines as they are added to the file (default: False)
+    - file_path: The path of the file to read from
+    - max_chunk_size: The max size of a yielded chunk in bytes (default: 64 KB)
 
     Returns:
-    - A generator that yields each new line in the file
-    """
-    file.seek(0)
-
-    # start infinite loop
-    while True:
-        # read last line of file
-        line = file.readline()
-        if not line:
-            if not follow:
-                break
-            # sleep if file hasn't been updated
+    - A generator that yields chunks of complete lines, or None once it has caught up with the file. The file is
+      reopened when it's rotated, and read from the start again when it's truncated.
+    """
+    file = open(file_path, 'rb')
+    offset = 0
+
+    try:
+        while True:
+            size = os.fstat(file.fileno()).st_size
+
+            if size < offset:
+                # file was truncated, start over
+                offset = 0
+
+            chunk = None
+
+            if size > offset:
+                try:
+                    mm = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+                except ValueError:
+                    # file was truncated to empty after the fstat
+                    mm = None
+
+                if mm is not None:
+                    with mm:
+                        chunk_end = min(len(mm), offset + max_chunk_size)
+                        end = mm.rfind(b"\n", offset, chunk_end)
+
+                        # a single line longer than the chunk size
+                        if end == -1 and chunk_end - offset == max_chunk_size:
+                            end = chunk_end - 1
+
+                        if end != -1:
+                            chunk = mm[offset : end + 1]
+                            offset = end + 1
+
+            if chunk:
+                yield chunk
+                continue
+
+            # caught up, reopen the file if it has been rotated
+            try:
+                path_stat = os.stat(file_path)
+                file_stat = os.fstat(file.fileno())
+                if (path_stat.st_ino, path_stat.st_dev) != (file_stat.st_ino, file_stat.st_dev):
+                    file.close()
+                    file = open(file_path, 'rb')
+                    offset = 0
+                    continue
+            except FileNotFoundError:
+                pass
+
+            yield None
+    finally:
+        file.close()
+
+
+# inotify event masks from <sys/inotify.h>
+IN_MODIFY = 0x00000002
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_MOVE_SELF = 0x00000800
+
+
+def _get_file_identity(file_path: Path) -> Optional[tuple[int, int]]:
+    """
+    Returns the (inode, device) of the file currently at file_path, or None if it doesn't exist.
+    """
+    try:
+        file_stat = os.stat(file_path)
+    except FileNotFoundError:
+        return None
+    return file_stat.st_ino, file_stat.st_dev
+
+
+def _inotify_add_watch(libc, inotify_fd: int, path: Path, mask: int) -> bool:
+    return libc.inotify_add_watch(inotify_fd, str(path).encode(), mask) >= 0
+
+
+def _inotify_init():
+    """
+    Create a non blocking inotify fd.
+
+    Returns:
+    - A tuple of the loaded libc and the inotify fd, or None when inotify is not available on this system
+    """
+    if platform.system() != 'Linux':
+        return None
+
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        inotify_fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+    except (OSError, AttributeError):
+        return None
+
+    if inotify_fd < 0:
+        return None
+
+    return libc, inotify_fd
+
+
+def wait_for_file_changes(file_paths: list[Path], refresh_time: float = 0.1):
+    """
+    Generator function that yields once the files are being watched and then every time any of them is modified.
+
+    Blocks in the kernel using inotify where available, otherwise falls back to waking up every refresh_time. Files
+    which are rotated, i.e replaced by a new file at the same path, are watched again.
+
+    Parameters:
+    - file_paths: The files to watch
+    - refresh_time: The time interval (in seconds) to wait between checks when inotify is not available (default: 0.1)
+    """
+    inotify = _inotify_init()
+
+    if inotify is None:
+        while True:
+            yield
             time.sleep(refresh_time)
-            continue
-        line = line.strip("\n")
-        yield line
+
+    libc, inotify_fd = inotify
+    selector = selectors.DefaultSelector()
+
+    try:
+        # watch the parent dirs for files created or moved in, so rotated files wake us up
+        for directory in {path.parent for path in file_paths}:
+            if not _inotify_add_watch(libc, inotify_fd, directory, IN_CREATE | IN_MOVED_TO):
+                raise OSError(ctypes.get_errno(), f"Failed to watch {directory}")
+
+        # path -> identity of the watched file, watches are per inode so they have to be added again on rotation
+        watched_files: dict[Path, Optional[tuple[int, int]]] = {}
+        for path in file_paths:
+            _inotify_add_watch(libc, inotify_fd, path, IN_MODIFY | IN_MOVE_SELF)
+            watched_files[path] = _get_file_identity(path)
+
+        selector.register(inotify_fd, selectors.EVENT_READ)
+    except OSError:
+        # fallback to polling
+        selector.close()
+        os.close(inotify_fd)
+        while True:
+            yield
+            time.sleep(refresh_time)
+
+    try:
+        while True:
+            yield
+            selector.select()
+            # drain pending events, only the wakeup matters
+            try:
+                while os.read(inotify_fd, 4096):
+                    pass
+            except BlockingIOError:
+                pass
+
+            for path, identity in watched_files.items():
+                if _get_file_identity(path) != identity:
+                    _inotify_add_watch(libc, inotify_fd, path, IN_MODIFY | IN_MOVE_SELF)
+                    watched_files[path] = _get_file_identity(path)
+    finally:
+        selector.close()
+        os.close(inotify_fd)
 
 
 def get_container_name_prefix(site_name):
@@ -459,10 +608,17 @@ def save_dict_to_file(config: dict, json_file_path: Path):
         config (dict): A dictionary containing the key-value pairs.
     """
 
-    final_config = {}
+    current_config = {}
     with open(json_file_path, "r") as f:
-        final_config = json.load(f)
+        current_config = json.load(f)
+
+    final_config = dict(current_config)
     for key, value in config.items():
         final_config[key] = value
+
+    # avoid rewriting the file when nothing changed
+    if final_config == current_config:
+        return
+
     with open(json_file_path, "w") as f:
         json.dump(final_config, f)